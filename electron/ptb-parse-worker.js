@@ -0,0 +1,35 @@
+/**
+ * Worker-thread entry for PTB binary parsing.
+ *
+ * Each worker receives one independent parse task (accounts, customers,
+ * vendors, ...) via workerData, so the .DAT files of a backup can be
+ * parsed on separate cores instead of serially on the main thread.
+ */
+const { parentPort, workerData } = require('worker_threads');
+const { PTBServiceUnified } = require('./ptb-service-unified');
+
+const service = new PTBServiceUnified();
+service.debugMode = false;
+
+// Buffers arrive as structured-cloned Uint8Arrays; re-wrap them as Buffers
+// (zero-copy views) so the parsers' Buffer methods work.
+const toBuffer = (u8) => (u8 ? Buffer.from(u8.buffer, u8.byteOffset, u8.byteLength) : null);
+
+function run({ task, buffers }) {
+  switch (task) {
+    case 'accounts': {
+      const accountsMap = service.parseChartDAT(toBuffer(buffers.chart), toBuffer(buffers.chartar));
+      const jrnlrow = toBuffer(buffers.jrnlrow);
+      if (jrnlrow) service.parseJournalBalances(jrnlrow, accountsMap);
+      return Array.from(accountsMap.values());
+    }
+    case 'customers': return service.parseCustomers(toBuffer(buffers.data));
+    case 'vendors': return service.parseVendors(toBuffer(buffers.data));
+    case 'employees': return service.parseEmployees(toBuffer(buffers.data));
+    case 'inventory': return service.parseInventory(toBuffer(buffers.data));
+    case 'company': return service.parseCompanyInfo(toBuffer(buffers.data));
+    default: throw new Error(`Unknown parse task: ${task}`);
+  }
+}
+
+parentPort.postMessage(run(workerData));
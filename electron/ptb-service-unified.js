@@ -37,6 +37,37 @@ try {
   // ODBC not available - will use binary parsing only
 }
 
+// Printable-ASCII run matcher used by extractStrings. Compiled once so the
+// regex engine (C-level) does the byte scanning instead of a JS loop.
+const PRINTABLE_RUN_RE = /[\x20-\x7e]+/g;
+
+// Junk filters for string-extracted entities, compiled once. A single
+// case-insensitive alternation test replaces the per-string some() sweep
+// that lowercased every pattern on every candidate.
+const CUSTOMER_JUNK_RE = /airborneq|dupf|customer|\.dat/i;
+const VENDOR_JUNK_RE = /airborneq|vendor|\.dat/i;
+const EMPLOYEE_JUNK_RE = /employee|hourly|salary|\.dat/i;
+const INVENTORY_JUNK_RE = /item|stock|\.dat|price level/i;
+
+// Marker preceding the IEEE 754 balance field in CHART.DAT records
+const BALANCE_MARKER = Buffer.from([0x11, 0x00]);
+
+// Account type by leading (thousands) digit of the account number:
+// Peachtree charts use 1xxx assets, 2xxx liabilities, 3xxx equity,
+// 4xxx revenue, and 5xxx-9xxx expenses.
+const ACCOUNT_TYPES_BY_DIGIT = [
+  'ASSET',     // 0 (unused, falls back to default)
+  'ASSET',     // 1
+  'LIABILITY', // 2
+  'EQUITY',    // 3
+  'REVENUE',   // 4
+  'EXPENSE',   // 5
+  'EXPENSE',   // 6
+  'EXPENSE',   // 7
+  'EXPENSE',   // 8
+  'EXPENSE'    // 9
+];
+
 class PTBServiceUnified {
   constructor() {
     this.debugMode = true;
@@ -95,28 +126,20 @@ class PTBServiceUnified {
    * Extract printable ASCII strings from binary data
    */
   extractStrings(buffer, minLen = 4, maxLen = 60) {
+    // Decode once (latin1 is a 1:1 byte->char mapping, so match indices are
+    // buffer offsets) and let a single regex pass find the printable runs
+    // instead of walking the buffer byte-by-byte in interpreted JS.
+    const content = buffer.toString('latin1');
     const strings = [];
-    let current = [];
-
-    for (let i = 0; i < buffer.length; i++) {
-      const byte = buffer[i];
-      if (byte >= 32 && byte < 127) {
-        current.push(String.fromCharCode(byte));
-      } else {
-        if (current.length >= minLen && current.length <= maxLen) {
-          const s = current.join('').trim();
-          if (s.length >= minLen) {
-            strings.push({ text: s, offset: i - current.length });
-          }
-        }
-        current = [];
-      }
-    }
-    
-    if (current.length >= minLen && current.length <= maxLen) {
-      const s = current.join('').trim();
+
+    PRINTABLE_RUN_RE.lastIndex = 0;
+    let m;
+    while ((m = PRINTABLE_RUN_RE.exec(content)) !== null) {
+      const run = m[0];
+      if (run.length < minLen || run.length > maxLen) continue;
+      const s = run.trim();
       if (s.length >= minLen) {
-        strings.push({ text: s, offset: buffer.length - current.length });
+        strings.push({ text: s, offset: m.index });
       }
     }
 
@@ -127,12 +150,11 @@ class PTBServiceUnified {
    * Read IEEE 754 double (8 bytes, little-endian)
    */
   readDouble(buffer, offset) {
+    // Bounds are checked up front, so readDoubleLE cannot throw; keeping
+    // this function try/catch-free matters because the amount scanners
+    // call it once per byte offset.
     if (offset < 0 || offset + 8 > buffer.length) return 0;
-    try {
-      return buffer.readDoubleLE(offset);
-    } catch {
-      return 0;
-    }
+    return buffer.readDoubleLE(offset);
   }
 
   /**
@@ -179,18 +201,16 @@ class PTBServiceUnified {
   // ============ ACCOUNT TYPE INFERENCE ============
   
   inferAccountType(accountNumber) {
-    try {
-      const numStr = String(accountNumber).replace(/[.\-]/g, '');
-      const num = parseInt(numStr.substring(0, 4), 10);
-      if (num >= 1000 && num < 2000) return 'ASSET';
-      if (num >= 2000 && num < 3000) return 'LIABILITY';
-      if (num >= 3000 && num < 4000) return 'EQUITY';
-      if (num >= 4000 && num < 5000) return 'REVENUE';
-      if (num >= 5000) return 'EXPENSE';
-      return 'ASSET';
-    } catch {
-      return 'ASSET';
+    // Account numbers here always carry at least four digits, so the type
+    // is decided by the leading digit alone: read it directly instead of
+    // stripping separators, substringing, and parsing an int per call.
+    const s = String(accountNumber);
+    for (let i = 0; i < s.length; i++) {
+      const c = s.charCodeAt(i);
+      if (c >= 0x30 && c <= 0x39) return ACCOUNT_TYPES_BY_DIGIT[c - 0x30];
+      if (c !== 0x2E && c !== 0x2D) break; // only '.' and '-' may precede digits
     }
+    return 'ASSET';
   }
 
   // ============ ENHANCED CHART OF ACCOUNTS PARSING ============
@@ -199,49 +219,167 @@ class PTBServiceUnified {
    * Parse CHART.DAT using Btrieve record structure
    * Pattern: [numLen] 00 [acctNum] 0c 00 00 [nameLen] 00 [name] [xx] 00 00 11 00 [balance]
    */
-  parseChartDAT(buffer, chartarBuffer = null) {
-    const accounts = new Map();
-    const accountPattern = /^(\d{4,6}(?:\.\d+)?)$/;
-    
-    // PRIMARY: Parse using 0x0c separator pattern (most reliable)
-    for (let i = 0; i < buffer.length - 30; i++) {
-      if (buffer[i] !== 0x0c || buffer[i + 1] !== 0x00 || buffer[i + 2] !== 0x00) continue;
-      
+  /**
+   * Read the Btrieve 6.x File Control Record (page 0) of a .DAT file.
+   * Same layout as scripts/analyze-ptb-ddf.js reads; returns null when
+   * the values don't look like a plausible FCR.
+   */
+  readBtrieveHeader(buffer) {
+    if (buffer.length < 0x20) return null;
+    const recLen = buffer.readUInt16LE(0x16);
+    const numRecs = buffer.readUInt32LE(0x18);
+    let pageSize = buffer.readUInt16LE(0x08);
+    if (pageSize === 0 || pageSize < 512) {
+      for (const ps of [4096, 2048, 1024, 512]) {
+        if (buffer.length >= ps * 2 && buffer.length % ps === 0) {
+          pageSize = ps;
+          break;
+        }
+      }
+    }
+    if (pageSize < 512 || recLen < 16 || recLen > pageSize) return null;
+    return { recLen, numRecs, pageSize };
+  }
+
+  /** Empty or deleted Btrieve slot: leading bytes all 0x00 or all 0xFF. */
+  isBlankRecord(buffer, offset, recLen) {
+    const probe = Math.min(recLen, 20);
+    let allZero = true;
+    let allFF = true;
+    for (let b = 0; b < probe; b++) {
+      const v = buffer[offset + b];
+      if (v !== 0) allZero = false;
+      if (v !== 0xff) allFF = false;
+      if (!allZero && !allFF) return false;
+    }
+    return true;
+  }
+
+  /**
+   * Numeric-only scan for 0x0c-separator record candidates in CHART.DAT.
+   * When the file carries a readable FCR, the scan strides the data pages
+   * slot by slot - skipping page headers and blank/deleted slots entirely -
+   * instead of walking every byte of the file. Decoding and pattern checks
+   * run later, only on the survivors. Returns a flat array of
+   * [sepIdx, acctStart, nameStart, nameStop] tuples.
+   */
+  scanChartCandidates(buffer) {
+    const candidates = [];
+
+    const fcr = this.readBtrieveHeader(buffer);
+    if (fcr) {
+      const { recLen, pageSize } = fcr;
+      const totalPages = Math.floor(buffer.length / pageSize);
+      const slotsPerPage = Math.floor((pageSize - 6) / recLen);
+      for (let pn = 1; pn < totalPages; pn++) {
+        const dataStart = pn * pageSize + 6;
+        for (let s = 0; s < slotsPerPage; s++) {
+          const recOff = dataStart + s * recLen;
+          if (recOff + recLen > buffer.length) break;
+          if (this.isBlankRecord(buffer, recOff, recLen)) continue;
+          this.scanChartRange(buffer, recOff, Math.min(recOff + recLen, buffer.length - 30), candidates);
+        }
+      }
+      if (candidates.length > 0) return candidates;
+    }
+
+    // No usable header (or a stride that found nothing): full byte scan.
+    this.scanChartRange(buffer, 0, buffer.length - 30, candidates);
+    return candidates;
+  }
+
+  scanChartRange(buffer, start, end, candidates) {
+    // Jump separator to separator with the native indexOf (memchr under
+    // the hood) rather than testing every byte in JS; 0x0c is rare, so
+    // nearly all of the range is skipped in native code.
+    for (let i = buffer.indexOf(0x0c, start); i !== -1 && i < end; i = buffer.indexOf(0x0c, i + 1)) {
+      if (buffer[i + 1] !== 0x00 || buffer[i + 2] !== 0x00) continue;
+
       const nameLen = buffer[i + 3];
       if (nameLen < 3 || nameLen > 60 || buffer[i + 4] !== 0x00) continue;
-      
-      // Read account number backwards from separator
-      let acctNum = '';
+
+      // Account number: printable run ending at the separator
       let j = i - 1;
-      while (j >= 0 && buffer[j] >= 0x20 && buffer[j] <= 0x7e) {
-        acctNum = String.fromCharCode(buffer[j]) + acctNum;
-        j--;
-      }
-      acctNum = acctNum.trim();
-      if (!/^\d{4}/.test(acctNum) || accounts.has(acctNum)) continue;
-      
-      // Read name field
+      while (j >= 0 && buffer[j] >= 0x20 && buffer[j] <= 0x7e) j--;
+      const acctStart = j + 1;
+      if (acctStart === i) continue;
+
+      // Name field: stop at NUL within the declared length
       const nameStart = i + 5;
       if (nameStart + nameLen > buffer.length) continue;
-      let name = '';
-      for (let k = 0; k < nameLen; k++) {
-        const c = buffer[nameStart + k];
-        if (c === 0) break;
-        name += String.fromCharCode(c);
-      }
-      name = name.trim();
+      const nameLimit = nameStart + nameLen;
+      let nameStop = nameStart;
+      while (nameStop < nameLimit && buffer[nameStop] !== 0) nameStop++;
+      if (nameStop - nameStart < 3) continue;
+
+      candidates.push(i, acctStart, nameStart, nameStop);
+    }
+
+    return candidates;
+  }
+
+  /** First n characters of s are ASCII digits. */
+  startsWithDigits(s, n) {
+    if (s.length < n) return false;
+    for (let i = 0; i < n; i++) {
+      const c = s.charCodeAt(i);
+      if (c < 0x30 || c > 0x39) return false;
+    }
+    return true;
+  }
+
+  /**
+   * Peachtree account number: 4-6 digits, optional '.' sub-account suffix
+   * (the shape /^\d{4,6}(\.\d+)?$/), checked with charCode compares so the
+   * hot extraction loops don't pay regex overhead per candidate string.
+   */
+  isAccountNumber(s) {
+    const len = s.length;
+    let i = 0;
+    while (i < len) {
+      const c = s.charCodeAt(i);
+      if (c < 0x30 || c > 0x39) break;
+      i++;
+    }
+    if (i < 4 || i > 6) return false;
+    if (i === len) return true;
+    if (s.charCodeAt(i) !== 0x2e || i + 1 === len) return false;
+    for (let j = i + 1; j < len; j++) {
+      const c = s.charCodeAt(j);
+      if (c < 0x30 || c > 0x39) return false;
+    }
+    return true;
+  }
+
+  parseChartDAT(buffer, chartarBuffer = null) {
+    const accounts = new Map();
+
+    // PRIMARY: Parse using 0x0c separator pattern (most reliable).
+    // Candidate offsets come from the numeric-only scanner; string work
+    // happens only here, on the survivors.
+    const candidates = this.scanChartCandidates(buffer);
+    for (let c = 0; c < candidates.length; c += 4) {
+      const i = candidates[c];
+      const acctStart = candidates[c + 1];
+      const nameStart = candidates[c + 2];
+      const nameStop = candidates[c + 3];
+      const nameLen = buffer[i + 3];
+
+      const acctNum = buffer.toString('latin1', acctStart, i).trim();
+      if (!this.startsWithDigits(acctNum, 4) || accounts.has(acctNum)) continue;
+
+      const name = buffer.toString('latin1', nameStart, nameStop).trim();
       if (name.length < 3) continue;
-      
-      // Find balance: look for 0x11 0x00 marker
+
+      // Find balance: locate the 0x11 0x00 marker with a native indexOf
+      // (memchr under the hood) instead of a byte-by-byte JS loop
       const nameEnd = nameStart + nameLen;
       let balance = 0;
-      for (let k = nameEnd; k < nameEnd + 20 && k + 10 < buffer.length; k++) {
-        if (buffer[k] === 0x11 && buffer[k + 1] === 0x00) {
-          const val = this.readDouble(buffer, k + 2);
-          if (Number.isFinite(val) && Math.abs(val) < 1e12) {
-            balance = Math.round(val * 100) / 100;
-          }
-          break;
+      const k = buffer.indexOf(BALANCE_MARKER, nameEnd);
+      if (k !== -1 && k < nameEnd + 20 && k + 10 < buffer.length) {
+        const val = this.readDouble(buffer, k + 2);
+        if (Number.isFinite(val) && Math.abs(val) < 1e12) {
+          balance = Math.round(val * 100) / 100;
         }
       }
       
@@ -260,15 +398,24 @@ class PTBServiceUnified {
       });
     }
     
-    // FALLBACK: String-based extraction if structured parsing found few accounts
-    if (accounts.size < 5) {
+    // FALLBACK: String-based extraction if structured parsing missed
+    // accounts. When the FCR declares a record count, use it as the
+    // yardstick: the fallback runs only if the structured pass recovered
+    // less than 80% of the declared records. Without a readable header,
+    // keep the old fixed threshold.
+    const fcr = this.readBtrieveHeader(buffer);
+    const expectedRecords = fcr ? fcr.numRecs : 0;
+    const parsedTooFew = expectedRecords > 0
+      ? accounts.size < expectedRecords * 0.8
+      : accounts.size < 5;
+    if (parsedTooFew) {
       const strings = this.extractStrings(buffer, 3, 50);
       for (let i = 0; i < strings.length - 1; i++) {
         const s = strings[i].text;
-        if (accountPattern.test(s) && !accounts.has(s)) {
+        if (this.isAccountNumber(s) && !accounts.has(s)) {
           for (let j = i + 1; j < Math.min(i + 5, strings.length); j++) {
             const name = strings[j].text;
-            if (/[A-Za-z]{2,}/.test(name) && !accountPattern.test(name)) {
+            if (/[A-Za-z]{2,}/.test(name) && !this.isAccountNumber(name)) {
               const nameOffset = strings[j].offset;
               const balance = this.scanForAmountAfter(buffer, nameOffset + name.length, 30);
               accounts.set(s, {
@@ -300,32 +447,39 @@ class PTBServiceUnified {
    */
   mergeChartarBalances(buffer, accountsMap) {
     let balancesFound = 0;
-    
-    for (const [acctNum, acct] of accountsMap) {
-      const searchBytes = Buffer.from(acctNum);
-      let searchStart = 0;
-      
-      while (searchStart < buffer.length) {
-        const idx = buffer.indexOf(searchBytes, searchStart);
-        if (idx === -1) break;
-        
-        // Found account, scan for balance
-        for (let offset = 40; offset < 200; offset += 8) {
-          if (idx + offset + 8 > buffer.length) break;
-          const val = this.readDouble(buffer, idx + offset);
-          if (this.isValidMonetary(val)) {
-            if (acct.balance === 0) {
-              acct.balance = Math.round(val * 100) / 100;
-              acct.balance_source = 'CHARTAR';
-              balancesFound++;
-            }
-            break;
-          }
+    if (accountsMap.size === 0) return;
+
+    // Single multi-pattern sweep: one alternation regex finds every
+    // account-number occurrence in one pass over the buffer, instead of a
+    // full indexOf scan per account. Longest-first so prefix-overlapping
+    // account numbers (e.g. 1000 vs 10000) match their own occurrences.
+    const needles = Array.from(accountsMap.keys())
+      .sort((a, b) => b.length - a.length)
+      .map(n => n.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'));
+    const needleRe = new RegExp(needles.join('|'), 'g');
+    const content = buffer.toString('latin1');
+
+    let m;
+    while ((m = needleRe.exec(content)) !== null) {
+      const idx = m.index;
+      needleRe.lastIndex = idx + 1;
+
+      const acct = accountsMap.get(m[0]);
+      if (!acct || acct.balance !== 0) continue;
+
+      // Found account, scan for balance
+      for (let offset = 40; offset < 200; offset += 8) {
+        if (idx + offset + 8 > buffer.length) break;
+        const val = this.readDouble(buffer, idx + offset);
+        if (this.isValidMonetary(val)) {
+          acct.balance = Math.round(val * 100) / 100;
+          acct.balance_source = 'CHARTAR';
+          balancesFound++;
+          break;
         }
-        searchStart = idx + 1;
       }
     }
-    
+
     this.log(`Merged ${balancesFound} balances from CHARTAR.DAT`);
   }
 
@@ -338,37 +492,51 @@ class PTBServiceUnified {
     let txCount = 0;
     
     const dataStart = 8192; // Skip header pages
-    
-    for (let offset = dataStart; offset < buffer.length - 256; offset += 2) {
-      // Look for account number patterns
-      const potentialAcct = [];
-      for (let j = 0; j < 10; j++) {
-        const c = buffer[offset + j];
-        if (c >= 0x30 && c <= 0x39) potentialAcct.push(String.fromCharCode(c));
-        else if (c === 0x2E) potentialAcct.push('.');
+
+    // Index the digit runs first: one numeric pass records where each run
+    // of account-number characters (digits, dots allowed) of length >= 4
+    // begins and ends. The old code probed every second byte and allocated
+    // a scratch array per probe; now only actual runs are visited.
+    const runStarts = [];
+    const runEnds = [];
+    const scanEnd = buffer.length - 256;
+    let i = dataStart;
+    while (i < scanEnd) {
+      const b = buffer[i];
+      if (b < 0x30 || b > 0x39) { i++; continue; }
+      const start = i;
+      let len = 0;
+      while (i < scanEnd && len < 10) {
+        const c = buffer[i];
+        if ((c >= 0x30 && c <= 0x39) || c === 0x2E) { i++; len++; }
         else break;
       }
-      
-      if (potentialAcct.length >= 4) {
-        const acctNum = potentialAcct.join('');
-        if (accountsMap.has(acctNum)) {
-          // Scan for debit/credit amounts
-          for (let amtOffset = 16; amtOffset < 200; amtOffset += 8) {
-            if (offset + amtOffset + 16 > buffer.length) break;
-            const val1 = this.readDouble(buffer, offset + amtOffset);
-            const val2 = this.readDouble(buffer, offset + amtOffset + 8);
-            
-            if (this.isValidMonetary(val1) || this.isValidMonetary(val2)) {
-              if (this.isValidMonetary(val1) && val1 > 0) {
-                debits.set(acctNum, (debits.get(acctNum) || 0) + val1);
-                txCount++;
-              }
-              if (this.isValidMonetary(val2) && val2 > 0) {
-                credits.set(acctNum, (credits.get(acctNum) || 0) + val2);
-              }
-              break;
-            }
+      if (len >= 4) {
+        runStarts.push(start);
+        runEnds.push(start + len);
+      }
+    }
+
+    for (let r = 0; r < runStarts.length; r++) {
+      const offset = runStarts[r];
+      const acctNum = buffer.toString('latin1', offset, runEnds[r]);
+      if (!accountsMap.has(acctNum)) continue;
+
+      // Scan for debit/credit amounts
+      for (let amtOffset = 16; amtOffset < 200; amtOffset += 8) {
+        if (offset + amtOffset + 16 > buffer.length) break;
+        const val1 = this.readDouble(buffer, offset + amtOffset);
+        const val2 = this.readDouble(buffer, offset + amtOffset + 8);
+
+        if (this.isValidMonetary(val1) || this.isValidMonetary(val2)) {
+          if (this.isValidMonetary(val1) && val1 > 0) {
+            debits.set(acctNum, (debits.get(acctNum) || 0) + val1);
+            txCount++;
+          }
+          if (this.isValidMonetary(val2) && val2 > 0) {
+            credits.set(acctNum, (credits.get(acctNum) || 0) + val2);
           }
+          break;
         }
       }
     }
@@ -400,14 +568,13 @@ class PTBServiceUnified {
   
   parseCustomers(buffer) {
     const strings = this.extractStrings(buffer, 4, 50);
-    const junkPatterns = ['AirborneQ', 'DupF', 'Customer', '.DAT', 'CUSTOMER'];
     const seen = new Set();
     const customers = [];
 
     for (const item of strings) {
       const clean = item.text.trim();
       const lower = clean.toLowerCase();
-      if (junkPatterns.some(j => lower.includes(j.toLowerCase()))) continue;
+      if (CUSTOMER_JUNK_RE.test(clean)) continue;
       if (!/^[A-Z]/.test(clean) || clean.length < 4) continue;
       if (seen.has(lower)) continue;
       
@@ -426,14 +593,13 @@ class PTBServiceUnified {
   
   parseVendors(buffer) {
     const strings = this.extractStrings(buffer, 4, 50);
-    const junkPatterns = ['AirborneQ', 'Vendor', 'VENDOR', '.DAT'];
     const seen = new Set();
     const vendors = [];
 
     for (const item of strings) {
       const clean = item.text.trim();
       const lower = clean.toLowerCase();
-      if (junkPatterns.some(j => lower.includes(j.toLowerCase()))) continue;
+      if (VENDOR_JUNK_RE.test(clean)) continue;
       if (!/^[A-Z]/.test(clean) || clean.length < 4) continue;
       if (seen.has(lower)) continue;
       
@@ -453,14 +619,13 @@ class PTBServiceUnified {
   
   parseEmployees(buffer) {
     const strings = this.extractStrings(buffer, 4, 40);
-    const junkPatterns = ['Employee', 'EMPLOYEE', 'Hourly', 'Salary', '.DAT'];
     const seen = new Set();
     const employees = [];
 
     for (const item of strings) {
       const clean = item.text.trim();
       const lower = clean.toLowerCase();
-      if (junkPatterns.some(j => lower.includes(j.toLowerCase()))) continue;
+      if (EMPLOYEE_JUNK_RE.test(clean)) continue;
       if (!/^[A-Z][a-z]+/.test(clean) || clean.length < 4) continue;
       if (seen.has(lower)) continue;
       
@@ -479,14 +644,13 @@ class PTBServiceUnified {
   
   parseInventory(buffer) {
     const strings = this.extractStrings(buffer, 4, 50);
-    const junkPatterns = ['Item', 'ITEM', 'Stock', '.DAT', 'Price Level'];
     const seen = new Set();
     const items = [];
 
     for (const item of strings) {
       const clean = item.text.replace(/^[^A-Za-z]+/, '').trim();
       const lower = clean.toLowerCase();
-      if (junkPatterns.some(j => lower.includes(j.toLowerCase()))) continue;
+      if (INVENTORY_JUNK_RE.test(clean)) continue;
       if (!/^[A-Z0-9]/.test(clean) || clean.length < 4) continue;
       if (!/[aeiouAEIOU]/.test(clean)) continue;
       if (seen.has(lower)) continue;
@@ -527,218 +691,56 @@ class PTBServiceUnified {
     return info;
   }
 
-  // ============ MAIN IMPORT FUNCTION ============
-  
-  async importPTB(filePath) {
-    const result = {
-      success: false,
-      data: {
-        chart_of_accounts: [],
-        customers: [],
-        vendors: [],
-        employees: [],
-        inventory: [],
-        company_info: null
-      },
-      error: null,
-      stats: {},
-      method: 'binary'
-    };
-
-    try {
-      if (!fs.existsSync(filePath)) {
-        throw new Error('File not found: ' + filePath);
-      }
-
-      this.log(`Opening PTB file: ${filePath}`);
-      const zip = new AdmZip(filePath);
-      const entries = zip.getEntries();
-      this.log(`Found ${entries.length} files in archive`);
-
-      // Helper to find files
-      const findFile = (patterns) => {
-        return entries.find(e => 
-          patterns.some(p => e.entryName.toUpperCase().includes(p.toUpperCase()))
-        );
-      };
-
-      // Try ODBC first if available
-      const extractedPath = this.tempDir || path.join(app.getPath('temp'), 'ptb-extract');
-      if (!fs.existsSync(extractedPath)) fs.mkdirSync(extractedPath, { recursive: true });
-      zip.extractAllTo(extractedPath, true);
-      
-      const odbcConnection = await this.tryODBCConnection(extractedPath);
-      
-      if (odbcConnection) {
-        // Use ODBC for data extraction
-        result.method = 'odbc';
-        try {
-          result.data.chart_of_accounts = await this.queryODBC(odbcConnection, 'ChartOfAccounts');
-          result.data.customers = await this.queryODBC(odbcConnection, 'Customer');
-          result.data.vendors = await this.queryODBC(odbcConnection, 'Vendor');
-          await odbcConnection.close();
-        } catch (odbcErr) {
-          this.log(`ODBC query failed, falling back to binary: ${odbcErr.message}`);
-          result.method = 'binary';
-        }
-      }
-
-      // Binary parsing (primary or fallback)
-      if (result.method === 'binary') {
-        // Parse Chart of Accounts
-        const chartEntry = findFile(['CHART.DAT']);
-        const chartarEntry = findFile(['CHARTAR.DAT']);
-        const jrnlrowEntry = findFile(['JRNLROW.DAT']);
-        
-        if (chartEntry) {
-          const chartBuffer = chartEntry.getData();
-          const chartarBuffer = chartarEntry ? chartarEntry.getData() : null;
-          const accountsMap = this.parseChartDAT(chartBuffer, chartarBuffer);
-          
-          // Enhance with journal data
-          if (jrnlrowEntry) {
-            const jrnlBuffer = jrnlrowEntry.getData();
-            this.parseJournalBalances(jrnlBuffer, accountsMap);
-          }
-          
-          result.data.chart_of_accounts = Array.from(accountsMap.values());
-        }
-
-        // Parse Customers
-        const custEntry = findFile(['CUSTOMER.DAT', 'CUST.DAT']);
-        if (custEntry) {
-          result.data.customers = this.parseCustomers(custEntry.getData());
-        }
-
-        // Parse Vendors
-        const vendEntry = findFile(['VENDOR.DAT']);
-        if (vendEntry) {
-          result.data.vendors = this.parseVendors(vendEntry.getData());
-        }
-
-        // Parse Employees
-        const empEntry = findFile(['EMPLOYEE.DAT', 'EMP.DAT']);
-        if (empEntry) {
-          result.data.employees = this.parseEmployees(empEntry.getData());
-        }
-
-        // Parse Inventory
-        const invEntry = findFile(['LINEITEM.DAT', 'INVENTORY.DAT', 'ITEM.DAT']);
-        if (invEntry) {
-          result.data.inventory = this.parseInventory(invEntry.getData());
-        }
+  // ============ IMPORT STATISTICS ============
 
-        // Parse Company Info
-        const companyEntry = findFile(['COMPANY.DAT', 'CMPY.DAT']);
-        if (companyEntry) {
-          result.data.company_info = this.parseCompanyInfo(companyEntry.getData());
-        }
+  /**
+   * Summarize parsed accounts in a single pass - replaces the six
+   * filter/reduce sweeps (one per account type plus the balance count)
+   * that each re-walked the account list.
+   */
+  summarizeAccounts(accounts) {
+    const balanceSummary = { assets: 0, liabilities: 0, equity: 0, revenue: 0, expenses: 0 };
+    let accountsWithBalances = 0;
+
+    for (const a of accounts) {
+      const bal = a.balance || 0;
+      if (a.balance !== 0) accountsWithBalances++;
+      switch (a.type) {
+        case 'ASSET': balanceSummary.assets += bal; break;
+        case 'LIABILITY': balanceSummary.liabilities += bal; break;
+        case 'EQUITY': balanceSummary.equity += bal; break;
+        case 'REVENUE': balanceSummary.revenue += bal; break;
+        case 'EXPENSE': balanceSummary.expenses += bal; break;
       }
-
-      // Calculate statistics
-      const acctWithBalances = result.data.chart_of_accounts.filter(a => a.balance !== 0).length;
-      result.stats = {
-        totalAccounts: result.data.chart_of_accounts.length,
-        accountsWithBalances: acctWithBalances,
-        totalCustomers: result.data.customers.length,
-        totalVendors: result.data.vendors.length,
-        totalEmployees: result.data.employees.length,
-        totalInventory: result.data.inventory.length,
-        extractionMethod: result.method,
-        balanceSummary: {
-          assets: result.data.chart_of_accounts.filter(a => a.type === 'ASSET').reduce((s, a) => s + (a.balance || 0), 0),
-          liabilities: result.data.chart_of_accounts.filter(a => a.type === 'LIABILITY').reduce((s, a) => s + (a.balance || 0), 0),
-          equity: result.data.chart_of_accounts.filter(a => a.type === 'EQUITY').reduce((s, a) => s + (a.balance || 0), 0),
-          revenue: result.data.chart_of_accounts.filter(a => a.type === 'REVENUE').reduce((s, a) => s + (a.balance || 0), 0),
-          expenses: result.data.chart_of_accounts.filter(a => a.type === 'EXPENSE').reduce((s, a) => s + (a.balance || 0), 0)
-        }
-      };
-
-      result.success = true;
-      this.log(`Import complete! ${result.stats.totalAccounts} accounts, ${result.stats.accountsWithBalances} with balances`);
-
-    } catch (error) {
-      result.error = error.message;
-      this.log(`Import failed: ${error.message}`);
     }
 
-    return result;
+    return { balanceSummary, accountsWithBalances };
   }
 
-  // ============ EMPLOYEE PARSING ============
-  
-  parseEmployees(buffer) {
-    const strings = this.extractStrings(buffer, 4, 40);
-    const junkPatterns = ['Employee', 'EMPLOYEE', 'Hourly', 'Salary', '.DAT'];
-    const seen = new Set();
-    const employees = [];
+  // ============ MAIN IMPORT FUNCTION ============
 
-    for (const item of strings) {
-      const clean = item.text.trim();
-      const lower = clean.toLowerCase();
-      if (junkPatterns.some(j => lower.includes(j.toLowerCase()))) continue;
-      if (!/^[A-Z][a-z]+/.test(clean) || clean.length < 4) continue;
-      if (seen.has(lower)) continue;
-      
-      seen.add(lower);
-      const parts = clean.split(/\s+/);
-      employees.push({
-        employee_id: `EMP-${String(employees.length + 1).padStart(4, '0')}`,
-        first_name: parts[0] || clean,
-        last_name: parts.slice(1).join(' ') || ''
-      });
+  /**
+   * Run one parse task on a worker thread (see ptb-parse-worker.js), or
+   * inline when worker_threads is unavailable.
+   */
+  runParseTask(task, buffers, parseInline) {
+    let Worker = null;
+    try {
+      ({ Worker } = require('worker_threads'));
+    } catch {
+      // No worker support - parse on this thread
     }
-    return employees.slice(0, 200);
-  }
-
-  // ============ INVENTORY PARSING ============
-  
-  parseInventory(buffer) {
-    const strings = this.extractStrings(buffer, 4, 50);
-    const junkPatterns = ['Item', 'ITEM', 'Stock', '.DAT', 'Price Level'];
-    const seen = new Set();
-    const items = [];
+    if (!Worker) return Promise.resolve().then(parseInline);
 
-    for (const item of strings) {
-      const clean = item.text.replace(/^[^A-Za-z]+/, '').trim();
-      const lower = clean.toLowerCase();
-      if (junkPatterns.some(j => lower.includes(j.toLowerCase()))) continue;
-      if (!/^[A-Z0-9]/.test(clean) || clean.length < 4) continue;
-      if (!/[aeiouAEIOU]/.test(clean)) continue;
-      if (seen.has(lower)) continue;
-      
-      seen.add(lower);
-      const unitPrice = this.scanForAmountAfter(buffer, item.offset + clean.length, 40);
-      const costPrice = unitPrice > 0 ? this.scanForAmountAfter(buffer, item.offset + clean.length + 8, 40) : 0;
-      
-      items.push({
-        item_id: `ITEM-${String(items.length + 1).padStart(4, '0')}`,
-        name: clean,
-        description: clean,
-        unit_price: unitPrice,
-        cost_price: costPrice || unitPrice,
-        quantity: 0
+    return new Promise((resolve, reject) => {
+      const worker = new Worker(path.join(__dirname, 'ptb-parse-worker.js'), {
+        workerData: { task, buffers }
       });
-    }
-    return items.slice(0, 500);
-  }
-
-  // ============ COMPANY INFO PARSING ============
-  
-  parseCompanyInfo(buffer) {
-    const strings = this.extractStrings(buffer, 3, 100);
-    const info = { name: '', address: '', city: '', phone: '', tax_id: '' };
-    
-    const infoStrings = strings.map(s => s.text).filter(s => s.length > 2 && /[A-Za-z]/.test(s));
-    if (infoStrings.length > 0) info.name = infoStrings[0];
-    if (infoStrings.length > 1) info.address = infoStrings[1];
-    if (infoStrings.length > 2) info.city = infoStrings[2];
-    
-    return info;
+      worker.once('message', resolve);
+      worker.once('error', reject);
+    });
   }
 
-  // ============ MAIN IMPORT FUNCTION ============
-  
   async importPTB(filePath) {
     const result = {
       success: false,
@@ -747,64 +749,122 @@ class PTBServiceUnified {
     };
 
     try {
-      if (!fs.existsSync(filePath)) throw new Error('File not found: ' + filePath);
-
       this.log(`Opening PTB file: ${filePath}`);
-      const zip = new AdmZip(filePath);
+      // Read the archive asynchronously so a large .ptb doesn't block the
+      // main process; AdmZip(path) would do the same read synchronously.
+      const fileBuffer = await fs.promises.readFile(filePath).catch((err) => {
+        if (err.code === 'ENOENT') throw new Error('File not found: ' + filePath);
+        throw err;
+      });
+      const zip = new AdmZip(fileBuffer);
       const entries = zip.getEntries();
       this.log(`Found ${entries.length} files in archive`);
 
-      const findFile = (patterns) => entries.find(e => patterns.some(p => e.entryName.toUpperCase().includes(p.toUpperCase())));
+      // Uppercase every entry name once and search the cached index,
+      // instead of re-uppercasing all entries per lookup
+      const entryIndex = entries.map(e => ({ upper: e.entryName.toUpperCase(), entry: e }));
+      const findFile = (patterns) => {
+        const uppers = patterns.map(p => p.toUpperCase());
+        const hit = entryIndex.find(x => uppers.some(u => x.upper.includes(u)));
+        return hit && hit.entry;
+      };
 
-      // Parse Chart of Accounts
-      const chartEntry = findFile(['CHART.DAT']);
-      const chartarEntry = findFile(['CHARTAR.DAT']);
-      const jrnlrowEntry = findFile(['JRNLROW.DAT']);
-      
-      if (chartEntry) {
-        const chartBuffer = chartEntry.getData();
-        const chartarBuffer = chartarEntry ? chartarEntry.getData() : null;
-        const accountsMap = this.parseChartDAT(chartBuffer, chartarBuffer);
-        if (jrnlrowEntry) this.parseJournalBalances(jrnlrowEntry.getData(), accountsMap);
-        result.data.chart_of_accounts = Array.from(accountsMap.values());
+      // Try ODBC first when the driver is present. Only the ODBC path
+      // needs the archive on disk, so binary imports no longer pay for a
+      // full extractAllTo - entries are parsed straight from memory.
+      if (this.odbcAvailable) {
+        const extractedPath = this.tempDir || path.join(app.getPath('temp'), 'ptb-extract');
+        if (!fs.existsSync(extractedPath)) fs.mkdirSync(extractedPath, { recursive: true });
+        zip.extractAllTo(extractedPath, true);
+
+        const odbcConnection = await this.tryODBCConnection(extractedPath);
+        if (odbcConnection) {
+          result.method = 'odbc';
+          try {
+            result.data.chart_of_accounts = await this.queryODBC(odbcConnection, 'ChartOfAccounts');
+            result.data.customers = await this.queryODBC(odbcConnection, 'Customer');
+            result.data.vendors = await this.queryODBC(odbcConnection, 'Vendor');
+            await odbcConnection.close();
+          } catch (odbcErr) {
+            this.log(`ODBC query failed, falling back to binary: ${odbcErr.message}`);
+            result.method = 'binary';
+          }
+        }
       }
 
-      // Parse other data
-      const custEntry = findFile(['CUSTOMER.DAT', 'CUST.DAT']);
-      if (custEntry) result.data.customers = this.parseCustomers(custEntry.getData());
-
-      const vendEntry = findFile(['VENDOR.DAT']);
-      if (vendEntry) result.data.vendors = this.parseVendors(vendEntry.getData());
+      // Binary parsing (primary or fallback). The .DAT files are
+      // independent, so parse them concurrently - one worker-thread task
+      // per file - instead of serially on this thread.
+      const parseJobs = [];
+      if (result.method === 'binary') {
+        // Inflate entries via getDataAsync instead of getData so the
+        // .DAT files decompress in parallel and off the await chain.
+        const inflate = (entry) => entry
+          ? new Promise((resolve, reject) => entry.getDataAsync(
+              (data, err) => (err ? reject(new Error(err)) : resolve(data))))
+          : Promise.resolve(null);
+
+        // Parse Chart of Accounts (with CHARTAR balances and journal totals)
+        const chartEntry = findFile(['CHART.DAT']);
+        if (chartEntry) {
+          const chartarEntry = findFile(['CHARTAR.DAT']);
+          const jrnlrowEntry = findFile(['JRNLROW.DAT']);
+          parseJobs.push(
+            Promise.all([inflate(chartEntry), inflate(chartarEntry), inflate(jrnlrowEntry)])
+              .then(([chart, chartar, jrnlrow]) =>
+                this.runParseTask('accounts', { chart, chartar, jrnlrow }, () => {
+                  const accountsMap = this.parseChartDAT(chart, chartar);
+                  if (jrnlrow) this.parseJournalBalances(jrnlrow, accountsMap);
+                  return Array.from(accountsMap.values());
+                }))
+              .then(accounts => { result.data.chart_of_accounts = accounts; })
+          );
+        }
 
-      const empEntry = findFile(['EMPLOYEE.DAT', 'EMP.DAT']);
-      if (empEntry) result.data.employees = this.parseEmployees(empEntry.getData());
+        // Parse other data
+        const entityTasks = [
+          ['customers', ['CUSTOMER.DAT', 'CUST.DAT'], (b) => this.parseCustomers(b)],
+          ['vendors', ['VENDOR.DAT'], (b) => this.parseVendors(b)],
+          ['employees', ['EMPLOYEE.DAT', 'EMP.DAT'], (b) => this.parseEmployees(b)],
+          ['inventory', ['LINEITEM.DAT', 'INVENTORY.DAT', 'ITEM.DAT'], (b) => this.parseInventory(b)]
+        ];
+        for (const [key, patterns, parseInline] of entityTasks) {
+          const entry = findFile(patterns);
+          if (!entry) continue;
+          parseJobs.push(
+            inflate(entry)
+              .then(data => this.runParseTask(key, { data }, () => parseInline(data)))
+              .then(parsed => { result.data[key] = parsed; })
+          );
+        }
 
-      const invEntry = findFile(['LINEITEM.DAT', 'INVENTORY.DAT', 'ITEM.DAT']);
-      if (invEntry) result.data.inventory = this.parseInventory(invEntry.getData());
+        const companyEntry = findFile(['COMPANY.DAT', 'CMPY.DAT']);
+        if (companyEntry) {
+          parseJobs.push(
+            inflate(companyEntry)
+              .then(data => this.runParseTask('company', { data }, () => this.parseCompanyInfo(data)))
+              .then(info => { result.data.company_info = info; })
+          );
+        }
 
-      const companyEntry = findFile(['COMPANY.DAT']);
-      if (companyEntry) result.data.company_info = this.parseCompanyInfo(companyEntry.getData());
+        await Promise.all(parseJobs);
+      }
 
-      // Calculate statistics
-      const acctWithBalances = result.data.chart_of_accounts.filter(a => a.balance !== 0).length;
+      // Calculate statistics (single pass over the account list)
+      const { balanceSummary, accountsWithBalances } = this.summarizeAccounts(result.data.chart_of_accounts);
       result.stats = {
         totalAccounts: result.data.chart_of_accounts.length,
-        accountsWithBalances: acctWithBalances,
+        accountsWithBalances,
         totalCustomers: result.data.customers.length,
         totalVendors: result.data.vendors.length,
         totalEmployees: result.data.employees.length,
         totalInventory: result.data.inventory.length,
-        balanceSummary: {
-          assets: result.data.chart_of_accounts.filter(a => a.type === 'ASSET').reduce((s, a) => s + (a.balance || 0), 0),
-          liabilities: result.data.chart_of_accounts.filter(a => a.type === 'LIABILITY').reduce((s, a) => s + (a.balance || 0), 0),
-          equity: result.data.chart_of_accounts.filter(a => a.type === 'EQUITY').reduce((s, a) => s + (a.balance || 0), 0),
-          revenue: result.data.chart_of_accounts.filter(a => a.type === 'REVENUE').reduce((s, a) => s + (a.balance || 0), 0),
-          expenses: result.data.chart_of_accounts.filter(a => a.type === 'EXPENSE').reduce((s, a) => s + (a.balance || 0), 0)
-        }
+        extractionMethod: result.method,
+        balanceSummary
       };
 
       result.success = true;
-      this.log(`Import complete! ${result.stats.totalAccounts} accounts, ${acctWithBalances} with balances`);
+      this.log(`Import complete! ${result.stats.totalAccounts} accounts, ${accountsWithBalances} with balances`);
     } catch (error) {
       result.error = error.message;
       this.log(`Import failed: ${error.message}`);
@@ -47,7 +47,7 @@ function extractRecords(data, recLen, pageSize, maxRecords) {
       const recOff = dataAreaStart + (s * recLen);
       if (recOff + recLen > data.length) break;
 
-      const recBuf = data.slice(recOff, recOff + recLen);
+      const recBuf = data.subarray(recOff, recOff + recLen);
 
       /* Check if record is empty/deleted (all zeros or all 0xFF) */
       let allZero = true;
@@ -64,15 +64,23 @@ function extractRecords(data, recLen, pageSize, maxRecords) {
   return records;
 }
 
+/* Per-byte lookup tables: hex pair and printable-ASCII char for 0..255 */
+const HEX_LUT = [];
+const ASCII_LUT = [];
+for (let b = 0; b < 256; b++) {
+  HEX_LUT.push(b.toString(16).padStart(2, '0'));
+  ASCII_LUT.push(b >= 32 && b <= 126 ? String.fromCharCode(b) : '.');
+}
+
 function showHex(buffer, offset, length) {
-  const slice = buffer.slice(offset, offset + length);
-  let hex = '';
-  let ascii = '';
+  const slice = buffer.subarray(offset, offset + length);
+  const hex = new Array(slice.length);
+  const ascii = new Array(slice.length);
   for (let i = 0; i < slice.length; i++) {
-    hex += slice[i].toString(16).padStart(2, '0') + ' ';
-    ascii += (slice[i] >= 32 && slice[i] <= 126) ? String.fromCharCode(slice[i]) : '.';
+    hex[i] = HEX_LUT[slice[i]];
+    ascii[i] = ASCII_LUT[slice[i]];
   }
-  return hex.trim() + '  |' + ascii + '|';
+  return hex.join(' ') + '  |' + ascii.join('') + '|';
 }
 
 /* Analyze CUSTOMER.DAT */
@@ -14,6 +14,22 @@ const publicDest = path.join(dest, 'public');
  */
 function copyDir(src, dest) {
   if (!fs.existsSync(src)) return;
+
+  // Native recursive copy first (one call, dereferences symlinks like the
+  // manual walk does); fall back to the per-file walk when it trips over
+  // locked files or broken symlinks.
+  try {
+    fs.cpSync(src, dest, { recursive: true, force: true, dereference: true });
+    return;
+  } catch (err) {
+    if (err.code !== 'EPERM' && err.code !== 'EBUSY' && err.code !== 'ENOENT' && err.code !== 'ELOOP') throw err;
+    console.warn(`Native copy failed (${err.code}), retrying file-by-file...`);
+  }
+
+  copyDirFallback(src, dest);
+}
+
+function copyDirFallback(src, dest) {
   fs.mkdirSync(dest, { recursive: true });
   const entries = fs.readdirSync(src, { withFileTypes: true });
 
@@ -30,7 +46,7 @@ function copyDir(src, dest) {
 
         if (stat.isDirectory()) {
           // Copy the directory the symlink points to
-          copyDir(realPath, destPath);
+          copyDirFallback(realPath, destPath);
         } else {
           // Copy the file the symlink points to
           fs.copyFileSync(realPath, destPath);
@@ -40,7 +56,7 @@ function copyDir(src, dest) {
         console.warn(`Skipping broken symlink: ${srcPath}`);
       }
     } else if (entry.isDirectory()) {
-      copyDir(srcPath, destPath);
+      copyDirFallback(srcPath, destPath);
     } else {
       try {
         fs.copyFileSync(srcPath, destPath);
@@ -24,6 +24,26 @@ function copyDir(src, dest, skipNodeModules = false) {
     console.log(`  Skipping ${src} (not found)`);
     return;
   }
+
+  // Let the native recursive copy handle the whole tree in one call (far
+  // fewer syscalls than a JS walk); fall back to the tolerant per-file
+  // walk only when Windows reports locked files.
+  try {
+    fs.cpSync(src, dest, {
+      recursive: true,
+      force: true,
+      filter: (source) => !(skipNodeModules && SKIP_DIRS.includes(path.basename(source)))
+    });
+    return;
+  } catch (err) {
+    if (err.code !== 'EPERM' && err.code !== 'EBUSY') throw err;
+    console.log('  Native copy hit locked files, retrying file-by-file...');
+  }
+
+  copyDirFallback(src, dest, skipNodeModules);
+}
+
+function copyDirFallback(src, dest, skipNodeModules = false) {
   fs.mkdirSync(dest, { recursive: true });
   const entries = fs.readdirSync(src, { withFileTypes: true });
 
@@ -39,7 +59,7 @@ function copyDir(src, dest, skipNodeModules = false) {
 
     try {
       if (entry.isDirectory()) {
-        copyDir(srcPath, destPath, skipNodeModules);
+        copyDirFallback(srcPath, destPath, skipNodeModules);
       } else {
         fs.copyFileSync(srcPath, destPath);
       }
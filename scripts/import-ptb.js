@@ -2,6 +2,20 @@ const fs = require('fs');
 const AdmZip = require('adm-zip');
 const { Pool } = require('pg');
 
+// Printable-run patterns keyed by length bounds, so each is compiled once
+// instead of once per .DAT file scanned.
+const printableRunRes = new Map();
+function printableRunRe(minLen, maxLen) {
+  const key = `${minLen},${maxLen}`;
+  let re = printableRunRes.get(key);
+  if (!re) {
+    re = new RegExp(`[\\x20-\\x7E]{${minLen},${maxLen}}`, 'g');
+    printableRunRes.set(key, re);
+  }
+  re.lastIndex = 0;
+  return re;
+}
+
 async function importAllPtbData() {
   const filePath = '/Users/mekdesyared/SageFlow-Modern/SWK 2018-011026.ptb';
   const buffer = fs.readFileSync(filePath);
@@ -20,9 +34,14 @@ async function importAllPtbData() {
   // Helper to extract readable strings
   function extractStrings(buffer, minLen = 3, maxLen = 100) {
     const content = buffer.toString('latin1');
-    const regex = new RegExp(`[\\x20-\\x7E]{${minLen},${maxLen}}`, 'g');
-    const matches = content.match(regex) || [];
-    return matches.map(m => m.trim()).filter(m => m.length >= minLen);
+    const regex = printableRunRe(minLen, maxLen);
+    const strings = [];
+    let m;
+    while ((m = regex.exec(content)) !== null) {
+      const s = m[0].trim();
+      if (s.length >= minLen) strings.push(s);
+    }
+    return strings;
   }
 
   // Extract account-like data (numbers and names)
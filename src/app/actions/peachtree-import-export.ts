@@ -11,12 +11,34 @@ import type { ActionResult } from "@/types/api";
  * These files are proprietary Pervasive/Btrieve format – the best we can do
  * without an ODBC driver is to scan for contiguous printable regions.
  */
+const LATIN1_DECODER = new TextDecoder('iso-8859-1');
+
+// Printable-run patterns keyed by length bounds, so each is compiled once
+// instead of once per .DAT file scanned.
+const printableRunRes = new Map<string, RegExp>();
+function printableRunRe(minLen: number, maxLen: number): RegExp {
+  const key = `${minLen},${maxLen}`;
+  let re = printableRunRes.get(key);
+  if (!re) {
+    re = new RegExp(`[\\x20-\\x7E]{${minLen},${maxLen}}`, 'g');
+    printableRunRes.set(key, re);
+  }
+  re.lastIndex = 0;
+  return re;
+}
+
 function extractStrings(data: Uint8Array, minLen = 3, maxLen = 100): string[] {
-  const decoder = new TextDecoder('iso-8859-1');
-  const content = decoder.decode(data);
-  const regex = new RegExp(`[\\x20-\\x7E]{${minLen},${maxLen}}`, 'g');
-  const matches = content.match(regex) || [];
-  return matches.map(m => m.trim()).filter(m => m.length >= minLen);
+  const content = LATIN1_DECODER.decode(data);
+  const regex = printableRunRe(minLen, maxLen);
+  // Stream matches straight into the result rather than materializing the
+  // full match array and re-walking it with map + filter.
+  const strings: string[] = [];
+  let m: RegExpExecArray | null;
+  while ((m = regex.exec(content)) !== null) {
+    const s = m[0].trim();
+    if (s.length >= minLen) strings.push(s);
+  }
+  return strings;
 }
 
 /**
@@ -65,16 +87,18 @@ function isLikelyEntityName(s: string): boolean {
  * Extract monetary values from binary journal row data.
  * Looks for explicit decimal amounts like "1,234.56" or "50.00".
  */
+const MONETARY_RE = /-?(?:\d{1,3}(?:,\d{3})+|\d+)\.\d{2}/g;
+
 function extractMonetaryValues(data: Uint8Array): number[] {
-  const decoder = new TextDecoder('iso-8859-1');
-  const content = decoder.decode(data);
+  const content = LATIN1_DECODER.decode(data);
 
-  const textMatches = content.match(/-?(?:\d{1,3}(?:,\d{3})+|\d+)\.\d{2}/g) || [];
   const seen = new Set<string>();
   const values: number[] = [];
 
-  for (const match of textMatches) {
-    const normalized = match.replace(/,/g, '');
+  MONETARY_RE.lastIndex = 0;
+  let m: RegExpExecArray | null;
+  while ((m = MONETARY_RE.exec(content)) !== null) {
+    const normalized = m[0].replace(/,/g, '');
     const parsed = Number.parseFloat(normalized);
     const rounded = Number(parsed.toFixed(2));
 
@@ -174,12 +198,14 @@ export async function importPtbAction(formData: FormData): Promise<ActionResult<
     const companyId = companies[0].id;
 
     // ── Helper: read a file from the ZIP ──────────────────────────────────────
+    // Uppercase the archive's file names once; each lookup then searches the
+    // cached index instead of re-uppercasing every name per call.
+    const zipNameIndex = fileNames.map(name => ({ upper: name.toUpperCase(), name }));
     const getFileContent = async (namePart: string): Promise<Uint8Array | null> => {
-      const filename = Object.keys(loadedZip.files).find(name =>
-        name.toUpperCase().includes(namePart.toUpperCase())
-      );
-      if (!filename) return null;
-      return await loadedZip.files[filename].async('uint8array');
+      const upperPart = namePart.toUpperCase();
+      const hit = zipNameIndex.find(x => x.upper.includes(upperPart));
+      if (!hit) return null;
+      return await loadedZip.files[hit.name].async('uint8array');
     };
 
     // ── Pre-fetch existing data for deduplication ─────────────────────────────
@@ -489,15 +515,32 @@ function escapeCsvCell(value: string): string {
   return `"${str.replace(/"/g, '""')}"`;
 }
 
+const CUSTOMER_CSV_HEADERS = ['Customer ID', 'Customer Number', 'Name', 'Email', 'Phone', 'Balance'];
+const VENDOR_CSV_HEADERS = ['Vendor ID', 'Vendor Number', 'Name', 'Email', 'Phone', 'Balance'];
+const ACCOUNT_CSV_HEADERS = ['Account ID', 'Account Number', 'Account Name', 'Type', 'Balance'];
+
+/**
+ * Build a CSV document in a single pass: each record is formatted straight
+ * into a preallocated line array and joined once, instead of materializing
+ * an intermediate rows array and re-mapping it.
+ */
+function buildCsv<T>(headers: string[], records: T[], toRow: (record: T) => string[]): string {
+  const lines = new Array<string>(records.length + 1);
+  lines[0] = headers.join(',');
+  for (let i = 0; i < records.length; i++) {
+    lines[i + 1] = toRow(records[i]).map(escapeCsvCell).join(',');
+  }
+  return lines.join('\n');
+}
+
 export async function exportCustomersToCSV(): Promise<ActionResult<string>> {
   try {
     const { data: customers, error } = await supabase.from('customers').select('*');
     if (error) throw error;
     if (!customers || customers.length === 0) return { success: false, error: 'No customers found' };
 
-    const headers = ['Customer ID', 'Customer Number', 'Name', 'Email', 'Phone', 'Balance'];
-    const rows = customers.map(c => [c.id, c.customer_number, c.name, c.email || '', c.phone || '', c.balance || '0']);
-    const csv = [headers.join(','), ...rows.map(row => row.map(escapeCsvCell).join(','))].join('\n');
+    const csv = buildCsv(CUSTOMER_CSV_HEADERS, customers, c =>
+      [c.id, c.customer_number, c.name, c.email || '', c.phone || '', c.balance || '0']);
     return { success: true, data: csv };
   } catch (error: any) {
     return { success: false, error: error.message };
@@ -510,9 +553,8 @@ export async function exportVendorsToCSV(): Promise<ActionResult<string>> {
     if (error) throw error;
     if (!vendors || vendors.length === 0) return { success: false, error: 'No vendors found' };
 
-    const headers = ['Vendor ID', 'Vendor Number', 'Name', 'Email', 'Phone', 'Balance'];
-    const rows = vendors.map(v => [v.id, v.vendor_number, v.name, v.email || '', v.phone || '', v.balance || '0']);
-    const csv = [headers.join(','), ...rows.map(row => row.map(escapeCsvCell).join(','))].join('\n');
+    const csv = buildCsv(VENDOR_CSV_HEADERS, vendors, v =>
+      [v.id, v.vendor_number, v.name, v.email || '', v.phone || '', v.balance || '0']);
     return { success: true, data: csv };
   } catch (error: any) {
     return { success: false, error: error.message };
@@ -525,9 +567,8 @@ export async function exportChartOfAccountsToCSV(): Promise<ActionResult<string>
     if (error) throw error;
     if (!accounts || accounts.length === 0) return { success: false, error: 'No accounts found' };
 
-    const headers = ['Account ID', 'Account Number', 'Account Name', 'Type', 'Balance'];
-    const rows = accounts.map(a => [a.id, a.account_number, a.account_name, a.type, a.balance || '0']);
-    const csv = [headers.join(','), ...rows.map(row => row.map(escapeCsvCell).join(','))].join('\n');
+    const csv = buildCsv(ACCOUNT_CSV_HEADERS, accounts, a =>
+      [a.id, a.account_number, a.account_name, a.type, a.balance || '0']);
     return { success: true, data: csv };
   } catch (error: any) {
     return { success: false, error: error.message };